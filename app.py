@@ -1,131 +1,412 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Response, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
-from pddiktipy import api
+from flask_caching import Cache
+from flask_compress import Compress
+from cachetools import TTLCache
+from pddiktipy import api, ValidationError
+import orjson
+import xxhash
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import atexit
 import logging
-from typing import Dict, Any, Optional
+import os
+import queue
+import threading
+from typing import Dict, Any, Iterator, Optional, Tuple
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# orjson options shared by the JSON provider and the response helpers
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for faster serialization"""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS).decode('utf-8')
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)  # Enable CORS for all routes
 
+# Compress large JSON payloads (search results, visualizations)
+app.config.update(
+    COMPRESS_ALGORITHM=['br', 'gzip'],
+    COMPRESS_MIN_SIZE=1024,
+    COMPRESS_LEVEL=4,
+    COMPRESS_BR_LEVEL=4
+)
+Compress(app)
+
+# Response cache: Redis when CACHE_REDIS_URL is set, in-process otherwise
+CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL')
+cache = Cache(app, config={
+    'CACHE_TYPE': 'RedisCache' if CACHE_REDIS_URL else 'SimpleCache',
+    'CACHE_REDIS_URL': CACHE_REDIS_URL,
+    'CACHE_DEFAULT_TIMEOUT': 300,
+    # Responses, memoized SDK calls and not-found markers share one store
+    'CACHE_THRESHOLD': int(os.environ.get('CACHE_THRESHOLD', '10000'))
+})
+
+def cache_get(key: str) -> Any:
+    """Read from the shared cache, treating backend errors (e.g. Redis down) as a miss"""
+    try:
+        return cache.get(key)
+    except Exception as e:
+        logger.warning(f"Cache read failed for {key}: {e}")
+        return None
+
+def cache_set(key: str, value: Any, timeout: int) -> None:
+    """Write to the shared cache, ignoring backend errors"""
+    try:
+        cache.set(key, value, timeout=timeout)
+    except Exception as e:
+        logger.warning(f"Cache write failed for {key}: {e}")
+
+# Cache lifetimes (seconds) per endpoint group
+SEARCH_CACHE_TIMEOUT = 600
+DETAIL_CACHE_TIMEOUT = 3600
+STATIC_CACHE_TIMEOUT = 86400
+SDK_CACHE_TIMEOUT = 1800
+NEGATIVE_CACHE_TIMEOUT = 300
+
+# Short-lived in-process cache absorbing bursts of identical search keywords
+# before they reach the shared (Redis) cache
+SEARCH_MEMORY_TTL = 60
+_search_cache: TTLCache = TTLCache(maxsize=1024, ttl=SEARCH_MEMORY_TTL)
+_search_cache_lock = threading.Lock()
+
+# Worker threads used to fan out independent upstream calls concurrently.
+# The calls are I/O-bound, so many threads can wait on the upstream at once.
+UPSTREAM_WORKERS = int(os.environ.get('PDDIKTI_UPSTREAM_WORKERS', '32'))
+
+# Small separate pool for speculative prefetching, so background warming
+# never queues ahead of the fan-out for real requests
+PREFETCH_WORKERS = 2
+PREFETCH_MAX_PENDING = 16
+
+# Request-handling threads per process (see gunicorn.conf.py)
+REQUEST_THREADS = int(os.environ.get('GUNICORN_THREADS', '32'))
+
+# Pool of reusable SDK clients so HTTP sessions (and their keep-alive
+# connections) survive across requests instead of being rebuilt per request.
+# Sized for every thread that can borrow a client at once, so the pool does
+# not run dry and fall back to building (and closing) throwaway clients.
+CLIENT_POOL_SIZE = int(os.environ.get(
+    'PDDIKTI_CLIENT_POOL_SIZE', str(REQUEST_THREADS + UPSTREAM_WORKERS + PREFETCH_WORKERS)
+))
+_client_pool: 'queue.Queue[api]' = queue.Queue(maxsize=CLIENT_POOL_SIZE)
+
+@contextmanager
+def pooled_client() -> Iterator[api]:
+    """Borrow an SDK client from the pool, returning it when done"""
+    try:
+        client = _client_pool.get_nowait()
+    except queue.Empty:
+        client = api()
+    try:
+        yield client
+    finally:
+        try:
+            _client_pool.put_nowait(client)
+        except queue.Full:
+            client.close()
+
+@atexit.register
+def _close_client_pool() -> None:
+    """Close every pooled SDK client on interpreter shutdown"""
+    while True:
+        try:
+            _client_pool.get_nowait().close()
+        except queue.Empty:
+            break
+
+_executor = ThreadPoolExecutor(max_workers=UPSTREAM_WORKERS, thread_name_prefix='pddikti')
+_prefetch_executor = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, thread_name_prefix='pddikti-prefetch')
+_prefetch_slots = threading.BoundedSemaphore(PREFETCH_MAX_PENDING)
+
+class UpstreamError(Exception):
+    """Raised when the PDDIKTI upstream failed instead of answering"""
+
+def is_not_found(error: Optional[Exception]) -> bool:
+    """Whether an SDK error means the requested record does not exist"""
+    return isinstance(error, ValidationError) or getattr(error, 'status_code', None) == 404
+
+def sdk_call(method: str, *args: Any) -> Any:
+    """Call an SDK method by name on a pooled client
+
+    The SDK turns every failure into ``None``; this returns ``None`` only for
+    records that do not exist and raises UpstreamError for timeouts, rate
+    limits and server errors, so failures are never cached as empty results.
+    """
+    with pooled_client() as client:
+        result = getattr(client, method)(*args)
+        error = client.last_error
+    if result is None and error is not None and not is_not_found(error):
+        raise UpstreamError(f"{method} failed: {error}")
+    return result
+
+@cache.memoize(timeout=SDK_CACHE_TIMEOUT)
+def cached_sdk_call(method: str, *args: Any) -> Any:
+    """Memoized sdk_call, so sub-results are shared between aggregate endpoints"""
+    return sdk_call(method, *args)
+
+def cached_search(method: str, keyword: str) -> Any:
+    """Run an SDK search, reusing recent results for the same normalized keyword
+
+    Lookups go to the in-process TTL cache first, then the shared cache, and
+    only then upstream, so a burst of one keyword costs no Redis round-trips.
+    """
+    normalized = keyword.strip().lower()
+    memory_key = (method, normalized)
+    with _search_cache_lock:
+        result = _search_cache.get(memory_key)
+    if result is not None:
+        return result
+    
+    shared_key = f'search:{method}:{normalized}'
+    result = cache_get(shared_key)
+    if result is None:
+        result = sdk_call(method, keyword)
+        if result is None:
+            return None
+        cache_set(shared_key, result, SEARCH_CACHE_TIMEOUT)
+    
+    with _search_cache_lock:
+        _search_cache[memory_key] = result
+    return result
+
+def fetch_concurrently(calls: Dict[str, Tuple[Any, ...]], required: bool = False) -> Dict[str, Any]:
+    """Run independent SDK calls concurrently
+
+    Maps each result key to a ``(method_name, *args)`` tuple and returns the
+    results under the same keys. Each call borrows its own pooled client and
+    is memoized individually. With ``required``, an empty sub-result raises
+    UpstreamError instead of producing a partial payload.
+    """
+    futures = {
+        key: _executor.submit(cached_sdk_call, *call)
+        for key, call in calls.items()
+    }
+    results = {key: future.result() for key, future in futures.items()}
+    if required:
+        missing = [key for key, value in results.items() if value is None]
+        if missing:
+            raise UpstreamError(f"Missing upstream data for {', '.join(missing)}")
+    return results
+
+# Speculatively warm the follow-up calls (logo, stats) after a university
+# detail lookup, hiding their upstream latency behind client think time
+PREFETCH_ENABLED = os.environ.get('PDDIKTI_PREFETCH', 'true').lower() in ('1', 'true', 'yes')
+
+# SDK methods behind /universities/<id>/stats, keyed by result name
+UNIVERSITY_STATS_METHODS = {
+    # Basic counts
+    'student_count': 'get_jumlah_mahasiswa_pt',
+    'lecturer_count': 'get_jumlah_dosen_pt',
+    'program_count': 'get_jumlah_prodi_pt',
+    # Ratios and rates
+    'ratio': 'get_rasio_pt',
+    'graduation_rate': 'get_graduation_rate_pt',
+    'cost_range': 'get_cost_range_pt'
+}
+
+def _warm_university(university_id: str) -> None:
+    """Run the memoized stats and logo calls for a university
+
+    A not-found result only skips that call; an upstream failure stops
+    the warm-up so a struggling upstream is not hit any harder.
+    """
+    for method in (*UNIVERSITY_STATS_METHODS.values(), 'get_logo_pt'):
+        try:
+            # Memoization makes this a cache lookup when the entry is already warm
+            cached_sdk_call(method, university_id)
+        except UpstreamError as e:
+            logger.debug(f"Prefetch for {university_id} stopped: {e}")
+            return
+
+def prefetch_university(university_id: str) -> None:
+    """Warm the logo and stats calls for a university in the background
+
+    Runs on the dedicated prefetch pool and is dropped when that pool
+    already has PREFETCH_MAX_PENDING lookups waiting.
+    """
+    if not PREFETCH_ENABLED or not _prefetch_slots.acquire(blocking=False):
+        return
+    future = _prefetch_executor.submit(_warm_university, university_id)
+    future.add_done_callback(lambda _: _prefetch_slots.release())
+
+def json_response(payload: Any) -> Response:
+    """Serialize payload with orjson into a JSON response"""
+    return Response(orjson.dumps(payload, option=ORJSON_OPTIONS), mimetype='application/json')
+
 def create_error_response(message: str, status_code: int = 400) -> tuple:
     """Create standardized error response"""
-    return jsonify({
+    return json_response({
         'success': False,
         'error': message,
         'data': None
     }), status_code
 
-def create_success_response(data: Any, message: str = "Success") -> Dict[str, Any]:
+def create_upstream_error_response(error: Exception) -> tuple:
+    """Create error response for an upstream failure (never cached)"""
+    logger.warning(f"Upstream PDDIKTI error: {error}")
+    return create_error_response("PDDIKTI upstream is unavailable, please try again later", 502)
+
+def is_cacheable(rv: Any) -> bool:
+    """Only cache successful responses so transient upstream errors are retried"""
+    status_code = rv[1] if isinstance(rv, tuple) else getattr(rv, 'status_code', 200)
+    return status_code < 400
+
+def is_known_missing(kind: str, item_id: str) -> bool:
+    """Check whether an ID recently came back as not found upstream"""
+    return bool(cache_get(f'neg:{kind}:{item_id}'))
+
+def remember_missing(kind: str, item_id: str) -> None:
+    """Remember a not-found ID so repeated lookups skip the upstream
+
+    Only called for genuine not-found results; sdk_call() raises
+    UpstreamError for timeouts, rate limits and server errors.
+    """
+    cache_set(f'neg:{kind}:{item_id}', True, NEGATIVE_CACHE_TIMEOUT)
+
+def create_success_response(data: Any, message: str = "Success") -> Response:
     """Create standardized success response"""
-    return jsonify({
+    return json_response({
         'success': True,
         'message': message,
         'data': data
     })
 
+# API information is static, so it is serialized once at import time
+HOME_INFO = {
+    'name': 'PDDIKTI REST API',
+    'version': '1.0.0',
+    'description': 'REST API wrapper for PDDIKTI (Pangkalan Data Pendidikan Tinggi) Indonesia',
+    'endpoints': {
+        'universities': {
+            'search': '/api/v1/universities/search?q=<keyword>',
+            'detail': '/api/v1/universities/<university_id>',
+            'programs': '/api/v1/universities/<university_id>/programs?semester=<semester>',
+            'logo': '/api/v1/universities/<university_id>/logo',
+            'statistics': '/api/v1/universities/<university_id>/stats'
+        },
+        'students': {
+            'search': '/api/v1/students/search?q=<keyword>',
+            'detail': '/api/v1/students/<student_id>'
+        },
+        'lecturers': {
+            'search': '/api/v1/lecturers/search?q=<keyword>',
+            'profile': '/api/v1/lecturers/<lecturer_id>',
+            'research': '/api/v1/lecturers/<lecturer_id>/research'
+        },
+        'programs': {
+            'search': '/api/v1/programs/search?q=<keyword>',
+            'detail': '/api/v1/programs/<program_id>'
+        },
+        'search': {
+            'all': '/api/v1/search?q=<keyword>'
+        },
+        'statistics': {
+            'counts': '/api/v1/statistics/counts',
+            'visualizations': '/api/v1/statistics/visualizations'
+        }
+    }
+}
+HOME_BYTES = orjson.dumps(HOME_INFO)
+HOME_ETAG = xxhash.xxh3_64_hexdigest(HOME_BYTES)
+
 @app.route('/')
 def home():
     """API Information endpoint"""
-    return jsonify({
-        'name': 'PDDIKTI REST API',
-        'version': '1.0.0',
-        'description': 'REST API wrapper for PDDIKTI (Pangkalan Data Pendidikan Tinggi) Indonesia',
-        'endpoints': {
-            'universities': {
-                'search': '/api/v1/universities/search?q=<keyword>',
-                'detail': '/api/v1/universities/<university_id>',
-                'programs': '/api/v1/universities/<university_id>/programs?semester=<semester>',
-                'logo': '/api/v1/universities/<university_id>/logo',
-                'statistics': '/api/v1/universities/<university_id>/stats'
-            },
-            'students': {
-                'search': '/api/v1/students/search?q=<keyword>',
-                'detail': '/api/v1/students/<student_id>'
-            },
-            'lecturers': {
-                'search': '/api/v1/lecturers/search?q=<keyword>',
-                'profile': '/api/v1/lecturers/<lecturer_id>',
-                'research': '/api/v1/lecturers/<lecturer_id>/research'
-            },
-            'programs': {
-                'search': '/api/v1/programs/search?q=<keyword>',
-                'detail': '/api/v1/programs/<program_id>'
-            },
-            'search': {
-                'all': '/api/v1/search?q=<keyword>'
-            },
-            'statistics': {
-                'counts': '/api/v1/statistics/counts',
-                'visualizations': '/api/v1/statistics/visualizations'
-            }
-        }
-    })
-
-# ========== UNIVERSITIES ENDPOINTS ==========
-
-@app.route('/api/v1/universities/search')
-def search_universities():
-    """Search universities by keyword"""
-    keyword = request.args.get('q', '').strip()
-
-    print(keyword)
+    response = Response(HOME_BYTES, mimetype='application/json')
+    response.headers['Cache-Control'] = f'public, max-age={STATIC_CACHE_TIMEOUT}'
+    response.set_etag(HOME_ETAG, weak=True)
+    return response.make_conditional(request)
+
+# ========== KEYWORD SEARCH ENDPOINTS ==========
+
+def normalize_search_result(result: Any) -> Tuple[Dict[str, Any], int]:
+    """Normalize dict or list search results into a ``{'data': [...]}`` payload and item count"""
+    if isinstance(result, dict):
+        items = result.get('data')
+        if items:
+            return result, len(items)
+    elif isinstance(result, list) and result:
+        # If result is a list, wrap it in the expected format
+        return {'data': result}, len(result)
+    return {'data': []}, 0
+
+def make_search_view(sdk_method: str, noun: str):
+    """Build a keyword search view for one entity type (results cached by cached_search)"""
+    # Messages are specialized per entity once, leaving only %-substitution per request
+    found_message = f"Found %d {noun} matching '%s'"
+    empty_message = f"No {noun} found matching '%s'"
+    error_message = f"Error searching {noun}: %s"
     
-    if not keyword:
-        return create_error_response("Query parameter 'q' is required")
-    try:
-        with api() as client:
-            result = client.search_pt(keyword)
-            
-            if result:
-                # Handle both dictionary and list responses
-                if isinstance(result, dict) and result.get('data'):
-                    return create_success_response(
-                        result, 
-                        f"Found {len(result['data'])} universities matching '{keyword}'"
-                    )
-                elif isinstance(result, list) and len(result) > 0:
-                    # If result is a list, wrap it in the expected format
-                    formatted_result = {'data': result}
-                    return create_success_response(
-                        formatted_result, 
-                        f"Found {len(result)} universities matching '{keyword}'"
-                    )
-                else:
-                    return create_success_response(
-                        {'data': []}, 
-                        f"No universities found matching '{keyword}'"
-                    )
-            else:
-                return create_success_response(
-                    {'data': []}, 
-                    f"No universities found matching '{keyword}'"
-                )
+    def search_view():
+        keyword = request.args.get('q', '').strip()
+        logger.debug("search %s q=%s", noun, keyword)
+        
+        if not keyword:
+            return create_error_response("Query parameter 'q' is required")
+        
+        try:
+            payload, count = normalize_search_result(cached_search(sdk_method, keyword))
+            message = found_message % (count, keyword) if count else empty_message % keyword
+            return create_success_response(payload, message)
                 
-    except Exception as e:
-        logger.error(f"Error searching universities: {e}")
-        return create_error_response(f"Internal server error: {str(e)}", 500)
+        except UpstreamError as e:
+            return create_upstream_error_response(e)
+        except Exception as e:
+            logger.error(error_message, e)
+            return create_error_response(f"Internal server error: {str(e)}", 500)
+    
+    search_view.__doc__ = f"Search {noun} by keyword"
+    return search_view
+
+for _path, _endpoint, _sdk_method, _noun in (
+    ('/api/v1/universities/search', 'search_universities', 'search_pt', 'universities'),
+    ('/api/v1/students/search', 'search_students', 'search_mahasiswa', 'students'),
+    ('/api/v1/lecturers/search', 'search_lecturers', 'search_dosen', 'lecturers'),
+    ('/api/v1/programs/search', 'search_programs', 'search_prodi', 'programs')
+):
+    app.add_url_rule(_path, endpoint=_endpoint, view_func=make_search_view(_sdk_method, _noun))
+
+# ========== UNIVERSITIES ENDPOINTS ==========
 
 @app.route('/api/v1/universities/<university_id>')
+@cache.cached(timeout=DETAIL_CACHE_TIMEOUT, response_filter=is_cacheable)
 def get_university_detail(university_id):
     """Get detailed information about a university"""
+    if is_known_missing('university', university_id):
+        return create_error_response("University not found", 404)
+    
     try:
-        with api() as client:
-            result = client.get_detail_pt(university_id)
+        result = sdk_call('get_detail_pt', university_id)
+        
+        if result:
+            prefetch_university(university_id)
+            return create_success_response(result, "University details retrieved successfully")
+        else:
+            remember_missing('university', university_id)
+            return create_error_response("University not found", 404)
             
-            if result:
-                return create_success_response(result, "University details retrieved successfully")
-            else:
-                return create_error_response("University not found", 404)
-                
+    except UpstreamError as e:
+        return create_upstream_error_response(e)
     except Exception as e:
         logger.error(f"Error getting university detail: {e}")
         return create_error_response(f"Internal server error: {str(e)}", 500)
 
 @app.route('/api/v1/universities/<university_id>/programs')
+@cache.cached(timeout=DETAIL_CACHE_TIMEOUT, query_string=True, response_filter=is_cacheable)
 def get_university_programs(university_id):
     """Get study programs offered by a university"""
     semester = request.args.get('semester', '')
@@ -134,19 +415,20 @@ def get_university_programs(university_id):
         return create_error_response("Query parameter 'semester' is required (format: YYYYS, e.g., 20241)")
     
     try:
-        with api() as client:
-            result = client.get_prodi_pt(university_id, semester)
-            if result and result.get('data'):
-                return create_success_response(
-                    result, 
-                    f"Found {len(result['data'])} programs for semester {semester}"
-                )
-            else:
-                return create_success_response(
-                    [], 
-                    f"No programs found for semester {semester}"
-                )
+        result = sdk_call('get_prodi_pt', university_id, semester)
+        if result and result.get('data'):
+            return create_success_response(
+                result, 
+                f"Found {len(result['data'])} programs for semester {semester}"
+            )
+        else:
+            return create_success_response(
+                [], 
+                f"No programs found for semester {semester}"
+            )
                 
+    except UpstreamError as e:
+        return create_upstream_error_response(e)
     except Exception as e:
         logger.error(f"Error getting university programs: {e}")
         return create_error_response(f"Internal server error: {str(e)}", 500)
@@ -154,258 +436,163 @@ def get_university_programs(university_id):
 @app.route('/api/v1/universities/<university_id>/logo')
 def get_university_logo(university_id):
     """Get university logo in base64 format"""
+    # Not response-cached: the memoized get_logo_pt call already holds the
+    # base64 payload, so caching the rendered response would store it twice
     try:
-        with api() as client:
-            result = client.get_logo_pt(university_id)
-            
-            if result:
-                return create_success_response({
-                    'logo_base64': result,
-                    'format': 'base64'
-                }, "University logo retrieved successfully")
-            else:
-                return create_error_response("University logo not found", 404)
+        result = cached_sdk_call('get_logo_pt', university_id)
+        
+        if result:
+            return create_success_response({
+                'logo_base64': result,
+                'format': 'base64'
+            }, "University logo retrieved successfully")
+        else:
+            return create_error_response("University logo not found", 404)
                 
+    except UpstreamError as e:
+        return create_upstream_error_response(e)
     except Exception as e:
         logger.error(f"Error getting university logo: {e}")
         return create_error_response(f"Internal server error: {str(e)}", 500)
 
 @app.route('/api/v1/universities/<university_id>/stats')
+@cache.cached(timeout=DETAIL_CACHE_TIMEOUT, response_filter=is_cacheable)
 def get_university_stats(university_id):
     """Get comprehensive statistics about a university"""
     try:
-        with api() as client:
-            # Gather multiple statistics
-            stats = {}
-            
-            # Basic counts
-            student_count = client.get_jumlah_mahasiswa_pt(university_id)
-            lecturer_count = client.get_jumlah_dosen_pt(university_id)
-            program_count = client.get_jumlah_prodi_pt(university_id)
-            
-            # Ratios and rates
-            ratio = client.get_rasio_pt(university_id)
-            graduation_rate = client.get_graduation_rate_pt(university_id)
-            cost_range = client.get_cost_range_pt(university_id)
-            
-            # Compile stats
-            stats = {
-                'students': student_count.get('jumlah_mahasiswa') if student_count else None,
-                'lecturers': lecturer_count.get('jumlah_dosen') if lecturer_count else None,
-                'programs': program_count.get('jumlah_prodi') if program_count else None,
-                'ratio': ratio.get('rasio') if ratio else None,
-                'graduation_rate': graduation_rate.get('graduation_rate') if graduation_rate else None,
-                'cost_range': cost_range.get('range_biaya_kuliah') if cost_range else None
-            }
-            
-            return create_success_response(stats, "University statistics retrieved successfully")
+        # Gather multiple statistics concurrently
+        results = fetch_concurrently({
+            key: (method, university_id)
+            for key, method in UNIVERSITY_STATS_METHODS.items()
+        })
+        student_count = results['student_count']
+        lecturer_count = results['lecturer_count']
+        program_count = results['program_count']
+        ratio = results['ratio']
+        graduation_rate = results['graduation_rate']
+        cost_range = results['cost_range']
+        
+        # Compile stats
+        stats = {
+            'students': student_count.get('jumlah_mahasiswa') if student_count else None,
+            'lecturers': lecturer_count.get('jumlah_dosen') if lecturer_count else None,
+            'programs': program_count.get('jumlah_prodi') if program_count else None,
+            'ratio': ratio.get('rasio') if ratio else None,
+            'graduation_rate': graduation_rate.get('graduation_rate') if graduation_rate else None,
+            'cost_range': cost_range.get('range_biaya_kuliah') if cost_range else None
+        }
+        
+        return create_success_response(stats, "University statistics retrieved successfully")
                 
+    except UpstreamError as e:
+        return create_upstream_error_response(e)
     except Exception as e:
         logger.error(f"Error getting university stats: {e}")
         return create_error_response(f"Internal server error: {str(e)}", 500)
 
 # ========== STUDENTS ENDPOINTS ==========
 
-@app.route('/api/v1/students/search')
-def search_students():
-    """Search students by keyword"""
-    keyword = request.args.get('q', '').strip()
-    
-    if not keyword:
-        return create_error_response("Query parameter 'q' is required")
-    
-    try:
-        with api() as client:
-            result = client.search_mahasiswa(keyword)
-            
-            if result:
-                # Handle both dictionary and list responses
-                if isinstance(result, dict) and result.get('data'):
-                    return create_success_response(
-                        result, 
-                        f"Found {len(result['data'])} students matching '{keyword}'"
-                    )
-                elif isinstance(result, list) and len(result) > 0:
-                    # If result is a list, wrap it in the expected format
-                    formatted_result = {'data': result}
-                    return create_success_response(
-                        formatted_result, 
-                        f"Found {len(result)} students matching '{keyword}'"
-                    )
-                else:
-                    return create_success_response(
-                        {'data': []}, 
-                        f"No students found matching '{keyword}'"
-                    )
-            else:
-                return create_success_response(
-                    {'data': []}, 
-                    f"No students found matching '{keyword}'"
-                )
-                
-    except Exception as e:
-        logger.error(f"Error searching students: {e}")
-        return create_error_response(f"Internal server error: {str(e)}", 500)
-
 @app.route('/api/v1/students/<student_id>')
+@cache.cached(timeout=DETAIL_CACHE_TIMEOUT, response_filter=is_cacheable)
 def get_student_detail(student_id):
     """Get detailed information about a student"""
+    if is_known_missing('student', student_id):
+        return create_error_response("Student not found", 404)
+    
     try:
-        with api() as client:
-            result = client.get_detail_mhs(student_id)
+        result = sdk_call('get_detail_mhs', student_id)
+        
+        if result:
+            return create_success_response(result, "Student details retrieved successfully")
+        else:
+            remember_missing('student', student_id)
+            return create_error_response("Student not found", 404)
             
-            if result:
-                return create_success_response(result, "Student details retrieved successfully")
-            else:
-                return create_error_response("Student not found", 404)
-                
+    except UpstreamError as e:
+        return create_upstream_error_response(e)
     except Exception as e:
         logger.error(f"Error getting student detail: {e}")
         return create_error_response(f"Internal server error: {str(e)}", 500)
 
 # ========== LECTURERS ENDPOINTS ==========
 
-@app.route('/api/v1/lecturers/search')
-def search_lecturers():
-    """Search lecturers by keyword"""
-    keyword = request.args.get('q', '').strip()
-    
-    if not keyword:
-        return create_error_response("Query parameter 'q' is required")
-    
-    try:
-        with api() as client:
-            result = client.search_dosen(keyword)
-            
-            if result:
-                # Handle both dictionary and list responses
-                if isinstance(result, dict) and result.get('data'):
-                    return create_success_response(
-                        result, 
-                        f"Found {len(result['data'])} lecturers matching '{keyword}'"
-                    )
-                elif isinstance(result, list) and len(result) > 0:
-                    # If result is a list, wrap it in the expected format
-                    formatted_result = {'data': result}
-                    return create_success_response(
-                        formatted_result, 
-                        f"Found {len(result)} lecturers matching '{keyword}'"
-                    )
-                else:
-                    return create_success_response(
-                        {'data': []}, 
-                        f"No lecturers found matching '{keyword}'"
-                    )
-            else:
-                return create_success_response(
-                    {'data': []}, 
-                    f"No lecturers found matching '{keyword}'"
-                )
-                
-    except Exception as e:
-        logger.error(f"Error searching lecturers: {e}")
-        return create_error_response(f"Internal server error: {str(e)}", 500)
-
 @app.route('/api/v1/lecturers/<lecturer_id>')
+@cache.cached(timeout=DETAIL_CACHE_TIMEOUT, response_filter=is_cacheable)
 def get_lecturer_profile(lecturer_id):
     """Get detailed profile of a lecturer"""
+    if is_known_missing('lecturer', lecturer_id):
+        return create_error_response("Lecturer not found", 404)
+    
     try:
-        with api() as client:
-            result = client.get_dosen_profile(lecturer_id)
+        result = sdk_call('get_dosen_profile', lecturer_id)
+        
+        if result:
+            return create_success_response(result, "Lecturer profile retrieved successfully")
+        else:
+            remember_missing('lecturer', lecturer_id)
+            return create_error_response("Lecturer not found", 404)
             
-            if result:
-                return create_success_response(result, "Lecturer profile retrieved successfully")
-            else:
-                return create_error_response("Lecturer not found", 404)
-                
+    except UpstreamError as e:
+        return create_upstream_error_response(e)
     except Exception as e:
         logger.error(f"Error getting lecturer profile: {e}")
         return create_error_response(f"Internal server error: {str(e)}", 500)
 
 @app.route('/api/v1/lecturers/<lecturer_id>/research')
+@cache.cached(timeout=DETAIL_CACHE_TIMEOUT, response_filter=is_cacheable)
 def get_lecturer_research(lecturer_id):
     """Get research activities of a lecturer"""
     try:
-        with api() as client:
-            research = client.get_dosen_penelitian(lecturer_id)
-            community_service = client.get_dosen_pengabdian(lecturer_id)
-            publications = client.get_dosen_karya(lecturer_id)
-            patents = client.get_dosen_paten(lecturer_id)
-            
-            result = {
-                'research': research.get('data', []) if research else [],
-                'community_service': community_service.get('data', []) if community_service else [],
-                'publications': publications.get('data', []) if publications else [],
-                'patents': patents.get('data', []) if patents else []
-            }
-            
-            return create_success_response(result, "Lecturer research activities retrieved successfully")
+        activities = fetch_concurrently({
+            'research': ('get_dosen_penelitian', lecturer_id),
+            'community_service': ('get_dosen_pengabdian', lecturer_id),
+            'publications': ('get_dosen_karya', lecturer_id),
+            'patents': ('get_dosen_paten', lecturer_id)
+        })
+        
+        result = {
+            key: value.get('data', []) if value else []
+            for key, value in activities.items()
+        }
+        
+        return create_success_response(result, "Lecturer research activities retrieved successfully")
                 
+    except UpstreamError as e:
+        return create_upstream_error_response(e)
     except Exception as e:
         logger.error(f"Error getting lecturer research: {e}")
         return create_error_response(f"Internal server error: {str(e)}", 500)
 
 # ========== PROGRAMS ENDPOINTS ==========
 
-@app.route('/api/v1/programs/search')
-def search_programs():
-    """Search study programs by keyword"""
-    keyword = request.args.get('q', '').strip()
-    
-    if not keyword:
-        return create_error_response("Query parameter 'q' is required")
-    
-    try:
-        with api() as client:
-            result = client.search_prodi(keyword)
-            
-            if result:
-                # Handle both dictionary and list responses
-                if isinstance(result, dict) and result.get('data'):
-                    return create_success_response(
-                        result, 
-                        f"Found {len(result['data'])} programs matching '{keyword}'"
-                    )
-                elif isinstance(result, list) and len(result) > 0:
-                    # If result is a list, wrap it in the expected format
-                    formatted_result = {'data': result}
-                    return create_success_response(
-                        formatted_result, 
-                        f"Found {len(result)} programs matching '{keyword}'"
-                    )
-                else:
-                    return create_success_response(
-                        {'data': []}, 
-                        f"No programs found matching '{keyword}'"
-                    )
-            else:
-                return create_success_response(
-                    {'data': []}, 
-                    f"No programs found matching '{keyword}'"
-                )
-                
-    except Exception as e:
-        logger.error(f"Error searching programs: {e}")
-        return create_error_response(f"Internal server error: {str(e)}", 500)
-
 @app.route('/api/v1/programs/<program_id>')
+@cache.cached(timeout=DETAIL_CACHE_TIMEOUT, response_filter=is_cacheable)
 def get_program_detail(program_id):
     """Get detailed information about a study program"""
+    if is_known_missing('program', program_id):
+        return create_error_response("Program not found", 404)
+    
     try:
-        with api() as client:
-            detail = client.get_detail_prodi(program_id)
-            description = client.get_desc_prodi(program_id)
-            
-            result = {
-                'detail': detail if detail else {},
-                'description': description if description else {}
-            }
-            
-            if detail or description:
-                return create_success_response(result, "Program details retrieved successfully")
-            else:
-                return create_error_response("Program not found", 404)
+        results = fetch_concurrently({
+            'detail': ('get_detail_prodi', program_id),
+            'description': ('get_desc_prodi', program_id)
+        })
+        detail = results['detail']
+        description = results['description']
+        
+        result = {
+            'detail': detail if detail else {},
+            'description': description if description else {}
+        }
+        
+        if detail or description:
+            return create_success_response(result, "Program details retrieved successfully")
+        else:
+            remember_missing('program', program_id)
+            return create_error_response("Program not found", 404)
                 
+    except UpstreamError as e:
+        return create_upstream_error_response(e)
     except Exception as e:
         logger.error(f"Error getting program detail: {e}")
         return create_error_response(f"Internal server error: {str(e)}", 500)
@@ -421,14 +608,17 @@ def search_all():
         return create_error_response("Query parameter 'q' is required")
     
     try:
-        with api() as client:
-            result = client.search_all(keyword)
+        # pddiktipy.search_all hits the combined pencarian/all endpoint, so this
+        # is already a single upstream request rather than one per category
+        result = cached_search('search_all', keyword)
+        
+        if result:
+            return create_success_response(result, f"Search completed for '{keyword}'")
+        else:
+            return create_success_response([], f"No results found for '{keyword}'")
             
-            if result:
-                return create_success_response(result, f"Search completed for '{keyword}'")
-            else:
-                return create_success_response([], f"No results found for '{keyword}'")
-                
+    except UpstreamError as e:
+        return create_upstream_error_response(e)
     except Exception as e:
         logger.error(f"Error in global search: {e}")
         return create_error_response(f"Internal server error: {str(e)}", 500)
@@ -436,72 +626,109 @@ def search_all():
 # ========== STATISTICS ENDPOINTS ==========
 
 @app.route('/api/v1/statistics/counts')
+@cache.cached(timeout=DETAIL_CACHE_TIMEOUT, response_filter=is_cacheable)
 def get_national_counts():
     """Get national statistics counts"""
     try:
-        with api() as client:
-            active_lecturers = client.get_dosen_count_active()
-            active_students = client.get_mahasiswa_count_active()
-            programs = client.get_prodi_count()
-            universities = client.get_pt_count()
-            
-            result = {
-                'active_lecturers': active_lecturers.get('jumlah_dosen') if active_lecturers else None,
-                'active_students': active_students.get('jumlah_mahasiswa') if active_students else None,
-                'programs': programs.get('jumlah') if programs else None,
-                'universities': universities.get('jumlah') if universities else None
-            }
-            
-            return create_success_response(result, "National statistics retrieved successfully")
+        counts = fetch_concurrently({
+            'active_lecturers': ('get_dosen_count_active',),
+            'active_students': ('get_mahasiswa_count_active',),
+            'programs': ('get_prodi_count',),
+            'universities': ('get_pt_count',)
+        }, required=True)
+        active_lecturers = counts['active_lecturers']
+        active_students = counts['active_students']
+        programs = counts['programs']
+        universities = counts['universities']
+        
+        result = {
+            'active_lecturers': active_lecturers.get('jumlah_dosen') if active_lecturers else None,
+            'active_students': active_students.get('jumlah_mahasiswa') if active_students else None,
+            'programs': programs.get('jumlah') if programs else None,
+            'universities': universities.get('jumlah') if universities else None
+        }
+        
+        return create_success_response(result, "National statistics retrieved successfully")
                 
+    except UpstreamError as e:
+        return create_upstream_error_response(e)
     except Exception as e:
         logger.error(f"Error getting national counts: {e}")
         return create_error_response(f"Internal server error: {str(e)}", 500)
 
+# SDK calls behind each visualization category, in fetch_concurrently() form
+VISUALIZATION_CALLS = {
+    'universities': {
+        'by_form': ('get_data_pt_bentuk',),
+        'by_accreditation': ('get_data_pt_akreditasi',),
+        'by_province': ('get_data_pt_provinsi',),
+        'by_supervisor_group': ('get_data_pt_kelompok_pembina',)
+    },
+    'students': {
+        'by_field': ('get_data_mahasiswa_bidang',),
+        'by_gender': ('get_data_mahasiswa_jenis_kelamin',),
+        'by_level': ('get_data_mahasiswa_jenjang',),
+        'by_status': ('get_data_mahasiswa_status',)
+    },
+    'lecturers': {
+        'by_activity': ('get_data_dosen_keaktifan',),
+        'by_field': ('get_data_dosen_bidang',),
+        'by_gender': ('get_data_dosen_jenis_kelamin',),
+        'by_level': ('get_data_dosen_jenjang',)
+    },
+    'programs': {
+        'by_level': ('get_data_prodi_jenjang',),
+        'by_accreditation': ('get_data_prodi_akreditasi',),
+        'by_field': ('get_data_prodi_bidang_ilmu',),
+        'by_supervisor_group': ('get_data_prodi_kelompok_pembina',)
+    }
+}
+INVALID_CATEGORY_MESSAGE = f"Invalid category. Valid options: {', '.join(VISUALIZATION_CALLS)}"
+
 @app.route('/api/v1/statistics/visualizations')
+@cache.cached(timeout=STATIC_CACHE_TIMEOUT, query_string=True, response_filter=is_cacheable)
 def get_visualization_data():
     """Get data for visualizations"""
     category = request.args.get('category', 'universities')
+    calls = VISUALIZATION_CALLS.get(category)
+    
+    if calls is None:
+        return create_error_response(INVALID_CATEGORY_MESSAGE)
     
     try:
-        with api() as client:
-            if category == 'universities':
-                result = {
-                    'by_form': client.get_data_pt_bentuk(),
-                    'by_accreditation': client.get_data_pt_akreditasi(),
-                    'by_province': client.get_data_pt_provinsi(),
-                    'by_supervisor_group': client.get_data_pt_kelompok_pembina()
-                }
-            elif category == 'students':
-                result = {
-                    'by_field': client.get_data_mahasiswa_bidang(),
-                    'by_gender': client.get_data_mahasiswa_jenis_kelamin(),
-                    'by_level': client.get_data_mahasiswa_jenjang(),
-                    'by_status': client.get_data_mahasiswa_status()
-                }
-            elif category == 'lecturers':
-                result = {
-                    'by_activity': client.get_data_dosen_keaktifan(),
-                    'by_field': client.get_data_dosen_bidang(),
-                    'by_gender': client.get_data_dosen_jenis_kelamin(),
-                    'by_level': client.get_data_dosen_jenjang()
-                }
-            elif category == 'programs':
-                result = {
-                    'by_level': client.get_data_prodi_jenjang(),
-                    'by_accreditation': client.get_data_prodi_akreditasi(),
-                    'by_field': client.get_data_prodi_bidang_ilmu(),
-                    'by_supervisor_group': client.get_data_prodi_kelompok_pembina()
-                }
-            else:
-                return create_error_response("Invalid category. Valid options: universities, students, lecturers, programs")
-            
-            return create_success_response(result, f"Visualization data for {category} retrieved successfully")
+        result = fetch_concurrently(calls, required=True)
+        
+        return create_success_response(result, f"Visualization data for {category} retrieved successfully")
                 
+    except UpstreamError as e:
+        return create_upstream_error_response(e)
     except Exception as e:
         logger.error(f"Error getting visualization data: {e}")
         return create_error_response(f"Internal server error: {str(e)}", 500)
 
+# ========== HTTP CACHING ==========
+
+# Browser/CDN cache lifetimes (seconds) for near-static endpoints. These
+# endpoints answer 502/404 instead of a partial 200 when upstream data is
+# missing, so only complete payloads ever get public caching headers.
+# home() sets its own headers from the precomputed HOME_ETAG.
+HTTP_CACHE_MAX_AGE = {
+    'get_visualization_data': STATIC_CACHE_TIMEOUT,
+    'get_national_counts': DETAIL_CACHE_TIMEOUT,
+    'get_university_logo': DETAIL_CACHE_TIMEOUT
+}
+
+@app.after_request
+def add_http_cache_headers(response: Response) -> Response:
+    """Add Cache-Control and ETag headers, answering If-None-Match with 304"""
+    max_age = HTTP_CACHE_MAX_AGE.get(request.endpoint)
+    if max_age is None or response.status_code != 200 or response.direct_passthrough:
+        return response
+    
+    response.headers['Cache-Control'] = f'public, max-age={max_age}'
+    response.set_etag(xxhash.xxh3_64_hexdigest(response.get_data()), weak=True)
+    return response.make_conditional(request)
+
 # ========== ERROR HANDLERS ==========
 
 @app.errorhandler(404)
@@ -517,4 +744,6 @@ def bad_request(error):
     return create_error_response("Bad request", 400)
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    # Development server only; use gunicorn (see gunicorn.conf.py) in production
+    debug = os.environ.get('FLASK_DEBUG', '').lower() in ('1', 'true', 'yes')
+    app.run(debug=debug, threaded=True, host='0.0.0.0', port=5000)
@@ -0,0 +1,16 @@
+"""
+Gunicorn configuration for the PDDIKTI REST API
+
+Handlers spend almost all their time waiting on the PDDIKTI upstream, so
+threaded workers let one process overlap many in-flight requests.
+Loaded automatically when running ``gunicorn app:app`` from this directory.
+"""
+
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+workers = int(os.environ.get('GUNICORN_WORKERS', '2'))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', '32'))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '60'))
+keepalive = 5
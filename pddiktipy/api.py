@@ -15,6 +15,16 @@ APIMethod = Callable[..., APIResponse]
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _record_error(args: Tuple[Any, ...], error: Optional[PDDIKTIError]) -> None:
+    """Store the error behind the latest call on the client instance, if any.
+    
+    Args:
+        args: Positional arguments of the wrapped call; the first is the client.
+        error: The error that caused a None result, or None on success.
+    """
+    if args and hasattr(args[0], 'last_error'):
+        args[0].last_error = error
+
 def handle_errors(func: APIMethod) -> APIMethod:
     """Decorator to handle errors for API calls with comprehensive error categorization.
     
@@ -33,10 +43,13 @@ def handle_errors(func: APIMethod) -> APIMethod:
     Note:
         This decorator automatically validates string parameters to ensure 
         they are not empty and handles various API-specific exceptions.
+        The exception behind a None result is kept on the client as
+        ``last_error`` so callers can tell a failure from a missing record.
     """
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> APIResponse:
         func_name = getattr(func, '__name__', 'unknown_function')
+        _record_error(args, None)
         
         try:
             # Input validation for common parameters
@@ -61,30 +74,37 @@ def handle_errors(func: APIMethod) -> APIMethod:
             
         except ValidationError as e:
             logger.error(f"{func_name}: Validation error - {e.message}")
+            _record_error(args, e)
             return None
             
         except APITimeoutError as e:
             logger.error(f"{func_name}: Timeout error - {e.message}")
+            _record_error(args, e)
             return None
             
         except APIConnectionError as e:
             logger.error(f"{func_name}: Connection error - {e.message}")
+            _record_error(args, e)
             return None
             
         except APIRateLimitError as e:
             logger.warning(f"{func_name}: Rate limit error - {e.message}")
+            _record_error(args, e)
             return None
             
         except APIResponseError as e:
             logger.error(f"{func_name}: Response error - {e.message}")
+            _record_error(args, e)
             return None
             
         except PDDIKTIError as e:
             logger.error(f"{func_name}: PDDIKTI API error - {e.message}")
+            _record_error(args, e)
             return None
             
         except Exception as e:
             logger.error(f"{func_name}: Unexpected error - {str(e)}", exc_info=True)
+            _record_error(args, PDDIKTIError(f"Unexpected error: {str(e)}"))
             return None
             
     return wrapper
@@ -110,6 +130,7 @@ class api:
         try:
             self.H: helper = helper()
             self.api_link: str = self.H.endpoint()
+            self.last_error: Optional[PDDIKTIError] = None
             self.logger: logging.Logger = logging.getLogger(__name__)
             self.logger.info("PDDIKTI API client initialized successfully")
             
@@ -9,7 +9,7 @@ from urllib3.util.retry import Retry
 from typing import Optional, Union, Any
 from .exceptions import (
     APIConnectionError, APITimeoutError, APIRateLimitError, 
-    APIResponseError, ValidationError
+    APIResponseError, ValidationError, PDDIKTIError
 )
 
 class helper:
@@ -35,10 +35,11 @@ class helper:
         if self._session is None:
             self._session = requests.Session()
             
-            # Retry strategy
+            # Retry strategy: few retries with a short backoff, so a failing
+            # upstream releases the caller quickly instead of stalling it
             retry_strategy = Retry(
-                total=3,
-                backoff_factor=1,
+                total=2,
+                backoff_factor=0.1,
                 status_forcelist=[429, 500, 502, 503, 504],
                 allowed_methods=["HEAD", "GET", "OPTIONS"]
             )
@@ -194,11 +195,20 @@ class helper:
                 f"Connection error: {str(e)}",
                 endpoint=endpoint
             )
+        except requests.HTTPError as e:
+            raise APIResponseError(
+                f"Request failed: {str(e)}",
+                status_code=e.response.status_code if e.response is not None else None,
+                endpoint=endpoint
+            )
         except requests.RequestException as e:
             raise APIResponseError(
                 f"Request failed: {str(e)}",
                 endpoint=endpoint
             )
+        except PDDIKTIError:
+            # Raised above with its status code; keep it intact
+            raise
         except Exception as e:
             self.logger.error(f"Unexpected error in response(): {e}")
             raise APIResponseError(
@@ -260,6 +270,12 @@ class helper:
                 f"Connection error fetching image: {str(e)}",
                 endpoint=url
             )
+        except requests.HTTPError as e:
+            raise APIResponseError(
+                f"Error fetching image: {str(e)}",
+                status_code=e.response.status_code if e.response is not None else None,
+                endpoint=url
+            )
         except requests.RequestException as e:
             raise APIResponseError(
                 f"Error fetching image: {str(e)}",
@@ -0,0 +1,484 @@
+"""
+PDDIKTI REST API (app.py) Test Suite
+
+Tests the Flask layer in app.py against a stubbed pddiktipy client, so no
+network access is needed. Covers the factory-registered search endpoints
+and their in-process keyword cache, search result normalization, the
+handling of upstream failures (which must never be cached) versus upstream
+404s, the negative cache for not-found IDs, the university prefetch, the
+memoized SDK calls and HTTP caching headers. The 404 cases are driven
+through the real pddiktipy helper.
+
+Test Framework: Python unittest (runs under pytest as well)
+"""
+
+import json
+import os
+import queue
+import sys
+import time
+import unittest
+from unittest import mock
+
+# Add the parent directory to the path to import app.py
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+try:
+    import flask  # noqa: F401
+    import app as app_module
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise unittest.SkipTest(f"REST API dependencies not installed: {e}")
+
+import requests
+
+from pddiktipy.exceptions import APIResponseError
+from pddiktipy.helper import helper
+
+
+SERVER_ERROR = APIResponseError("Server error: 503", status_code=503)
+
+
+class FakeApi:
+    """
+    Stand-in for pddiktipy.api driven by a shared table of canned results
+
+    ``responses`` maps SDK method names to a value, a callable producing one,
+    or a PDDIKTIError. Errors mimic the real SDK: the method returns None and
+    the error is kept on ``last_error``.
+    """
+
+    responses = {}
+    calls = []
+
+    def __init__(self):
+        self.last_error = None
+
+    def close(self):
+        pass
+
+    def __getattr__(self, name):
+        def method(*args):
+            FakeApi.calls.append((name,) + args)
+            outcome = FakeApi.responses.get(name)
+            if callable(outcome):
+                outcome = outcome(*args)
+            if isinstance(outcome, Exception):
+                self.last_error = outcome
+                return None
+            self.last_error = None
+            return outcome
+        return method
+
+
+class AppTestCase(unittest.TestCase):
+    """Base class wiring the Flask test client to FakeApi with empty caches"""
+
+    sdk_class = FakeApi
+
+    def setUp(self):
+        patchers = [
+            mock.patch.object(app_module, 'api', self.sdk_class),
+            mock.patch.object(app_module, 'PREFETCH_ENABLED', False),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        FakeApi.responses = {}
+        FakeApi.calls = []
+        self._drain_client_pool()
+        self.addCleanup(self._drain_client_pool)
+        app_module.cache.clear()
+        app_module._search_cache.clear()
+        self.client = app_module.app.test_client()
+
+    @staticmethod
+    def _drain_client_pool():
+        """Drop pooled clients so each test builds fresh SDK instances"""
+        while True:
+            try:
+                app_module._client_pool.get_nowait()
+            except queue.Empty:
+                break
+
+    def count_calls(self, method):
+        return sum(1 for call in FakeApi.calls if call[0] == method)
+
+
+class UpstreamHttpTestCase(AppTestCase):
+    """
+    Base class running the real pddiktipy client against stubbed HTTP
+
+    ``routes`` maps a URL fragment to a ``(status_code, body)`` pair; bytes
+    bodies are served as images, anything else as JSON. Unmatched URLs
+    answer 200 with an empty JSON object.
+    """
+
+    sdk_class = app_module.api
+    UNIVERSITY_ID = 'UNIV-0000000001'
+    LECTURER_ID = 'DOSEN-0000000001'
+
+    def setUp(self):
+        super().setUp()
+        self.routes = {}
+        self.requested = []
+        patchers = [
+            mock.patch.object(requests.Session, 'get', side_effect=self._fake_get),
+            mock.patch.object(helper, 'get_ip', return_value='127.0.0.1'),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _fake_get(self, url, headers=None, timeout=None):
+        self.requested.append(url)
+        status, body = next(
+            (route for fragment, route in self.routes.items() if fragment in url),
+            (200, {})
+        )
+        response = requests.Response()
+        response.status_code = status
+        response.url = url
+        if isinstance(body, bytes):
+            response.headers['content-type'] = 'image/png'
+            response._content = body
+        else:
+            response.headers['content-type'] = 'application/json'
+            response._content = json.dumps(body).encode()
+        return response
+
+    def count_requests(self, fragment):
+        return sum(1 for url in self.requested if fragment in url)
+
+
+class TestSearchEndpoints(AppTestCase):
+    """Tests for the search views built by make_search_view()"""
+
+    SEARCH_ROUTES = [
+        ('/api/v1/universities/search', 'search_universities', 'search_pt', 'universities'),
+        ('/api/v1/students/search', 'search_students', 'search_mahasiswa', 'students'),
+        ('/api/v1/lecturers/search', 'search_lecturers', 'search_dosen', 'lecturers'),
+        ('/api/v1/programs/search', 'search_programs', 'search_prodi', 'programs'),
+    ]
+
+    def test_routes_keep_urls_and_endpoint_names(self):
+        """Factory-registered search views keep their original URLs and endpoint names"""
+        rules = {rule.rule: rule.endpoint for rule in app_module.app.url_map.iter_rules()}
+        for path, endpoint, _, _ in self.SEARCH_ROUTES:
+            with self.subTest(path=path):
+                self.assertEqual(rules.get(path), endpoint)
+
+    def test_search_calls_sdk_and_formats_message(self):
+        """Each search endpoint calls its SDK method and reports the match count"""
+        for path, _, sdk_method, noun in self.SEARCH_ROUTES:
+            with self.subTest(path=path):
+                FakeApi.responses[sdk_method] = [{'id': '1'}, {'id': '2'}]
+                response = self.client.get(f'{path}?q=Budi')
+                body = response.get_json()
+
+                self.assertEqual(response.status_code, 200)
+                self.assertTrue(body['success'])
+                self.assertEqual(body['message'], f"Found 2 {noun} matching 'Budi'")
+                self.assertEqual(body['data'], {'data': [{'id': '1'}, {'id': '2'}]})
+                self.assertEqual(self.count_calls(sdk_method), 1)
+
+    def test_search_without_keyword_is_rejected(self):
+        """Missing q parameter returns 400 without calling the SDK"""
+        response = self.client.get('/api/v1/students/search')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(FakeApi.calls, [])
+
+    def test_search_with_no_results(self):
+        """An empty upstream result is reported as no matches"""
+        FakeApi.responses['search_dosen'] = []
+        response = self.client.get('/api/v1/lecturers/search?q=zzz')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['message'], "No lecturers found matching 'zzz'")
+        self.assertEqual(response.get_json()['data'], {'data': []})
+
+    def test_case_variants_are_served_from_memory(self):
+        """Repeated keywords (any case) skip both the SDK and the shared cache"""
+        FakeApi.responses['search_pt'] = [{'id': '1'}]
+        self.client.get('/api/v1/universities/search?q=UI')
+
+        with mock.patch.object(app_module, 'cache_get') as cache_get:
+            response = self.client.get('/api/v1/universities/search?q=ui')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['message'], "Found 1 universities matching 'ui'")
+        self.assertEqual(self.count_calls('search_pt'), 1)
+        cache_get.assert_not_called()
+
+
+class TestNormalizeSearchResult(unittest.TestCase):
+    """Tests for normalize_search_result()"""
+
+    def test_dict_with_data_is_passed_through(self):
+        result = {'data': [1, 2], 'total': 2}
+        self.assertEqual(app_module.normalize_search_result(result), (result, 2))
+
+    def test_dict_without_data_is_empty(self):
+        self.assertEqual(app_module.normalize_search_result({'data': []}), ({'data': []}, 0))
+        self.assertEqual(app_module.normalize_search_result({}), ({'data': []}, 0))
+
+    def test_list_is_wrapped(self):
+        self.assertEqual(app_module.normalize_search_result([1]), ({'data': [1]}, 1))
+
+    def test_empty_and_unexpected_values_are_empty(self):
+        for value in ([], None, 'unexpected'):
+            with self.subTest(value=value):
+                self.assertEqual(app_module.normalize_search_result(value), ({'data': []}, 0))
+
+
+class TestUpstreamFailuresNotCached(AppTestCase):
+    """A None result caused by an upstream failure must never be cached"""
+
+    VISUALIZATION_METHODS = [
+        'get_data_pt_bentuk', 'get_data_pt_akreditasi',
+        'get_data_pt_provinsi', 'get_data_pt_kelompok_pembina',
+    ]
+
+    def test_visualizations_recover_after_failure(self):
+        for method in self.VISUALIZATION_METHODS:
+            FakeApi.responses[method] = SERVER_ERROR
+        failed = self.client.get('/api/v1/statistics/visualizations')
+
+        for method in self.VISUALIZATION_METHODS:
+            FakeApi.responses[method] = {'data': [method]}
+        recovered = self.client.get('/api/v1/statistics/visualizations')
+
+        self.assertEqual(failed.status_code, 502)
+        self.assertEqual(recovered.status_code, 200)
+        self.assertEqual(recovered.get_json()['data']['by_form'], {'data': ['get_data_pt_bentuk']})
+
+    def test_search_recovers_after_failure(self):
+        FakeApi.responses['search_mahasiswa'] = SERVER_ERROR
+        failed = self.client.get('/api/v1/students/search?q=abc')
+
+        FakeApi.responses['search_mahasiswa'] = [{'id': '1'}]
+        recovered = self.client.get('/api/v1/students/search?q=abc')
+
+        self.assertEqual(failed.status_code, 502)
+        self.assertEqual(recovered.status_code, 200)
+        self.assertEqual(recovered.get_json()['message'], "Found 1 students matching 'abc'")
+
+    def test_stats_recover_after_failure(self):
+        FakeApi.responses['get_rasio_pt'] = SERVER_ERROR
+        failed = self.client.get('/api/v1/universities/u1/stats')
+
+        FakeApi.responses['get_rasio_pt'] = {'rasio': '1:20'}
+        recovered = self.client.get('/api/v1/universities/u1/stats')
+
+        self.assertEqual(failed.status_code, 502)
+        self.assertEqual(recovered.status_code, 200)
+        self.assertEqual(recovered.get_json()['data']['ratio'], '1:20')
+
+
+class TestUpstreamNotFound(UpstreamHttpTestCase):
+    """Upstream 404s seen through the real SDK are not-found, not outages"""
+
+    def test_sdk_keeps_404_status(self):
+        """Both JSON and image requests record the upstream status code"""
+        self.routes['/detail/pt/'] = (404, {})
+        self.routes['/pt/logo/'] = (404, {})
+        client = app_module.api()
+
+        for method in ('get_detail_pt', 'get_logo_pt'):
+            with self.subTest(method=method):
+                self.assertIsNone(getattr(client, method)(self.UNIVERSITY_ID))
+                self.assertEqual(client.last_error.status_code, 404)
+
+    def test_missing_university_detail_returns_404(self):
+        self.routes['/detail/pt/'] = (404, {})
+        response = self.client.get(f'/api/v1/universities/{self.UNIVERSITY_ID}')
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_missing_logo_returns_404(self):
+        self.routes['/pt/logo/'] = (404, {})
+        response = self.client.get(f'/api/v1/universities/{self.UNIVERSITY_ID}/logo')
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_logo_is_returned_as_base64(self):
+        self.routes['/pt/logo/'] = (200, b'PNG')
+        response = self.client.get(f'/api/v1/universities/{self.UNIVERSITY_ID}/logo')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['data']['logo_base64'], 'UE5H')
+
+    def test_stats_with_missing_cost_range_are_partial(self):
+        """A 404 on one stats sub-call leaves that field null"""
+        self.routes['/pt/cost-range/'] = (404, {})
+        self.routes['/pt/rasio/'] = (200, {'rasio': '1:20'})
+        response = self.client.get(f'/api/v1/universities/{self.UNIVERSITY_ID}/stats')
+        stats = response.get_json()['data']
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(stats['cost_range'])
+        self.assertEqual(stats['ratio'], '1:20')
+
+    def test_research_without_patents_is_empty_list(self):
+        self.routes['/portofolio/paten/'] = (404, {})
+        response = self.client.get(f'/api/v1/lecturers/{self.LECTURER_ID}/research')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['data']['patents'], [])
+
+    def test_server_error_returns_502(self):
+        self.routes['/detail/pt/'] = (503, {})
+        response = self.client.get(f'/api/v1/universities/{self.UNIVERSITY_ID}')
+
+        self.assertEqual(response.status_code, 502)
+
+
+class TestNegativeCache(UpstreamHttpTestCase):
+    """Tests for the not-found marker on detail endpoints"""
+
+    STUDENT_ID = 'MHS-0000000001'
+
+    def test_not_found_is_remembered_until_expiry(self):
+        """A real upstream 404 skips the upstream on repeat lookups until the marker expires"""
+        self.routes['/detail/mhs/'] = (404, {})
+
+        with mock.patch.object(app_module, 'NEGATIVE_CACHE_TIMEOUT', 1):
+            first = self.client.get(f'/api/v1/students/{self.STUDENT_ID}')
+            self.assertTrue(app_module.cache_get(f'neg:student:{self.STUDENT_ID}'))
+            second = self.client.get(f'/api/v1/students/{self.STUDENT_ID}')
+
+            self.assertEqual(first.status_code, 404)
+            self.assertEqual(second.status_code, 404)
+            self.assertEqual(self.count_requests('/detail/mhs/'), 1)
+
+            time.sleep(1.1)
+            self.routes['/detail/mhs/'] = (200, {'id': self.STUDENT_ID})
+            third = self.client.get(f'/api/v1/students/{self.STUDENT_ID}')
+
+        self.assertEqual(third.status_code, 200)
+        self.assertEqual(self.count_requests('/detail/mhs/'), 2)
+
+    def test_upstream_failure_is_not_remembered_as_missing(self):
+        """A 5xx from upstream returns 502 and does not mark the ID as missing"""
+        self.routes['/detail/mhs/'] = (503, {})
+        failed = self.client.get(f'/api/v1/students/{self.STUDENT_ID}')
+
+        self.assertIsNone(app_module.cache_get(f'neg:student:{self.STUDENT_ID}'))
+
+        self.routes['/detail/mhs/'] = (200, {'id': self.STUDENT_ID})
+        recovered = self.client.get(f'/api/v1/students/{self.STUDENT_ID}')
+
+        self.assertEqual(failed.status_code, 502)
+        self.assertEqual(recovered.status_code, 200)
+
+    def test_cache_outage_is_treated_as_miss(self):
+        """A failing cache backend does not break detail endpoints"""
+        self.routes['/detail/mhs/'] = (200, {'id': self.STUDENT_ID})
+
+        with mock.patch.object(app_module.cache, 'get', side_effect=ConnectionError("redis down")):
+            response = self.client.get(f'/api/v1/students/{self.STUDENT_ID}')
+
+        self.assertEqual(response.status_code, 200)
+
+
+class TestPrefetch(UpstreamHttpTestCase):
+    """Tests for warming a university's stats and logo after a detail lookup"""
+
+    STATS_FRAGMENTS = [
+        '/pt/jumlah-mahasiswa/', '/pt/jumlah-dosen/', '/pt/jumlah-prodi/',
+        '/pt/rasio/', '/pt/graduation-rate/', '/pt/cost-range/',
+    ]
+
+    def test_not_found_does_not_stop_warm_up(self):
+        """A 404 on one call still warms every other call"""
+        self.routes['/pt/jumlah-mahasiswa/'] = (404, {})
+        self.routes['/pt/logo/'] = (404, {})
+        app_module._warm_university(self.UNIVERSITY_ID)
+
+        for fragment in self.STATS_FRAGMENTS + ['/pt/logo/']:
+            with self.subTest(fragment=fragment):
+                self.assertEqual(self.count_requests(fragment), 1)
+
+        self.requested.clear()
+        response = self.client.get(f'/api/v1/universities/{self.UNIVERSITY_ID}/stats')
+
+        self.assertEqual(response.status_code, 200)
+        for fragment in self.STATS_FRAGMENTS[1:]:
+            self.assertEqual(self.count_requests(fragment), 0)
+
+    def test_upstream_failure_stops_warm_up(self):
+        self.routes['/pt/jumlah-mahasiswa/'] = (503, {})
+        app_module._warm_university(self.UNIVERSITY_ID)
+
+        self.assertEqual(len(self.requested), 1)
+
+
+class TestMemoizedSdkCalls(UpstreamHttpTestCase):
+    """Tests for the memoized SDK calls behind the aggregate endpoints"""
+
+    def test_logo_is_fetched_and_stored_once(self):
+        """Repeat logo requests reuse the memoized call without a response copy"""
+        self.routes['/pt/logo/'] = (200, b'PNG')
+        path = f'/api/v1/universities/{self.UNIVERSITY_ID}/logo'
+
+        with mock.patch.object(app_module.cache, 'set', wraps=app_module.cache.set) as cache_set:
+            first = self.client.get(path)
+            second = self.client.get(path)
+
+        self.assertEqual(first.get_json()['data'], second.get_json()['data'])
+        self.assertEqual(self.count_requests('/pt/logo/'), 1)
+        self.assertEqual(cache_set.call_count, 1)
+
+
+class TestHttpCaching(AppTestCase):
+    """Tests for Cache-Control / ETag headers and conditional requests"""
+
+    COUNTS = {
+        'get_dosen_count_active': {'jumlah_dosen': 1},
+        'get_mahasiswa_count_active': {'jumlah_mahasiswa': 2},
+        'get_prodi_count': {'jumlah': 3},
+        'get_pt_count': {'jumlah': 4},
+    }
+
+    def test_home_if_none_match_returns_304(self):
+        first = self.client.get('/')
+        etag = first.headers['ETag']
+        second = self.client.get('/', headers={'If-None-Match': etag})
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.headers['Cache-Control'], 'public, max-age=86400')
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.get_data(), b'')
+
+    def test_counts_if_none_match_returns_304(self):
+        FakeApi.responses.update(self.COUNTS)
+        first = self.client.get('/api/v1/statistics/counts')
+        second = self.client.get(
+            '/api/v1/statistics/counts', headers={'If-None-Match': first.headers['ETag']}
+        )
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.headers['Cache-Control'], 'public, max-age=3600')
+        self.assertEqual(second.status_code, 304)
+
+    def test_failed_counts_get_no_public_caching_headers(self):
+        FakeApi.responses.update(self.COUNTS)
+        FakeApi.responses['get_pt_count'] = SERVER_ERROR
+        response = self.client.get('/api/v1/statistics/counts')
+
+        self.assertEqual(response.status_code, 502)
+        self.assertNotIn('Cache-Control', response.headers)
+        self.assertNotIn('ETag', response.headers)
+
+    def test_logo_gets_caching_headers_without_response_cache(self):
+        FakeApi.responses['get_logo_pt'] = 'UE5H'
+        response = self.client.get('/api/v1/universities/u1/logo')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Cache-Control'], 'public, max-age=3600')
+        self.assertIn('ETag', response.headers)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)